@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Vectorized Australian address generation.
+
+Samples whole columns at a time with NumPy instead of calling Faker once per
+row, which keeps the inner loop in C and is an order of magnitude faster at
+large row counts. The trade-off is fidelity: street names and cities come
+from the fixed lists below rather than Faker's weighted providers, so use
+Faker (the --high-fidelity path in populate_table_local.py) when realistic
+distributions matter more than throughput.
+"""
+
+STREET_NAMES = (
+    'Acacia', 'Banksia', 'Boronia', 'Bottlebrush', 'Bridge', 'Chapel',
+    'Church', 'Collins', 'Edward', 'Elizabeth', 'Eucalyptus', 'Flinders',
+    'George', 'Grevillea', 'High', 'Hunter', 'Jacaranda', 'King', 'Lygon',
+    'Macquarie', 'Melaleuca', 'Murray', 'Oxford', 'Park', 'Pitt', 'Queen',
+    'Railway', 'Short', 'Station', 'Sturt', 'Victoria', 'Waratah', 'Wattle',
+    'William', 'York',
+)
+
+STREET_TYPES = (
+    'Street', 'Road', 'Avenue', 'Parade', 'Crescent', 'Drive', 'Court',
+    'Place', 'Lane', 'Way',
+)
+
+CITIES = (
+    'Sydney', 'Melbourne', 'Brisbane', 'Perth', 'Adelaide', 'Gold Coast',
+    'Newcastle', 'Canberra', 'Wollongong', 'Hobart', 'Geelong', 'Townsville',
+    'Cairns', 'Darwin', 'Toowoomba', 'Ballarat', 'Bendigo', 'Launceston',
+    'Mackay', 'Rockhampton', 'Bunbury', 'Bundaberg', 'Wagga Wagga',
+    'Hervey Bay', 'Mildura', 'Shepparton', 'Port Macquarie', 'Gladstone',
+    'Tamworth', 'Orange',
+)
+
+STATES = ('NSW', 'VIC', 'QLD', 'SA', 'WA', 'TAS', 'NT', 'ACT')
+
+def sample_rows(n, seed=None):
+    """Return n (street, city, state, postcode) tuples sampled with NumPy.
+
+    Each column is drawn in one vectorized call; pass a seed for
+    reproducible output. Requires the optional 'numpy' package.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+
+    numbers = rng.integers(1, 1000, size=n).astype(str)
+    names = rng.choice(STREET_NAMES, n)
+    types = rng.choice(STREET_TYPES, n)
+    streets = np.char.add(np.char.add(numbers, ' '),
+                          np.char.add(np.char.add(names, ' '), types))
+    cities = rng.choice(CITIES, n)
+    states = rng.choice(STATES, n)
+    postcodes = np.char.zfill(rng.integers(200, 10_000, size=n).astype(str), 4)
+
+    return list(zip(streets.tolist(), cities.tolist(),
+                    states.tolist(), postcodes.tolist()))
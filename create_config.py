@@ -5,10 +5,14 @@ This will create a config.ini file with separate local and remote database conne
 """
 
 import configparser
+import io
 import os
+import sys
 from getpass import getpass
 
-def get_connection_details(environment_name, default_server=None, default_database="sample_db"):
+from credentials import store_password
+
+def get_connection_details(environment_name, default_server=None, default_database="sample_db", passphrase=None):
     """Get connection details for a specific environment."""
     print(f"\n🔧 Configuring {environment_name.upper()} SQL Server Connection")
     print("=" * 50)
@@ -33,18 +37,19 @@ def get_connection_details(environment_name, default_server=None, default_databa
     if not username:
         print("❌ Username is required!")
         return None
-    
-    # Password configuration
-    password = getpass(f"Enter {environment_name} password (input hidden): ")
-    if not password:
-        print("❌ Password is required!")
-        return None
-    
+
     # Driver configuration
     driver = input(f"Enter {environment_name} ODBC driver (default: {{ODBC Driver 18 for SQL Server}}): ").strip()
     if not driver:
         driver = "{ODBC Driver 18 for SQL Server}"
-    
+
+    # Password configuration - prompted last, after every cheap field has
+    # validated, so an aborted run never reads a password into memory
+    password = getpass(f"Enter {environment_name} password (input hidden): ")
+    if not password:
+        print("❌ Password is required!")
+        return None
+
     # Environment-specific settings
     if environment_name.lower() == "local":
         trust_cert = "yes"
@@ -53,20 +58,25 @@ def get_connection_details(environment_name, default_server=None, default_databa
         trust_cert = "yes"
         encrypt = "yes"
     
-    return {
+    details = {
         'server': server,
         'database': database,
         'username': username,
-        'password': password,
+        # Store a keyring reference or Fernet token instead of the plaintext
+        # password whenever possible
+        'password': store_password(server, username, password, passphrase),
         'driver': driver,
         'trust_server_certificate': trust_cert,
         'encrypt': encrypt,
         'connection_timeout': '30'
     }
+    # Best-effort: don't keep the plaintext password alive in this frame
+    password = "\0" * len(password)
+    return details
 
-def create_config_file():
+def create_config_file(passphrase=None):
     """Create a configuration file with SQL Server connection settings."""
-    
+
     config = configparser.ConfigParser()
     config_file = 'config.ini'
     
@@ -111,7 +121,7 @@ def create_config_file():
         print("\n💻 LOCAL Configuration (typically for development/testing)")
         print("Common local servers: localhost, host.docker.internal, DATA-ENG-PYTHON\\MSSQLSERVER01")
         
-        local_config = get_connection_details("local", "host.docker.internal", "sample_db")
+        local_config = get_connection_details("local", "host.docker.internal", "sample_db", passphrase)
         if not local_config:
             return False
         
@@ -122,7 +132,7 @@ def create_config_file():
         print("\n☁️  REMOTE Configuration (typically for Azure SQL or remote servers)")
         print("Example: your-server.database.windows.net")
         
-        remote_config = get_connection_details("remote", None, "sample_db")
+        remote_config = get_connection_details("remote", None, "sample_db", passphrase)
         if not remote_config:
             return False
         
@@ -139,8 +149,12 @@ def create_config_file():
     # Write configuration file
     config_file = 'config.ini'
     try:
+        # Serialize to memory first so the file is written in one call
+        # instead of one small write per line
+        buf = io.StringIO()
+        config.write(buf)
         with open(config_file, 'w') as configfile:
-            config.write(configfile)
+            configfile.write(buf.getvalue())
         
         print(f"\n✅ Configuration file '{config_file}' created successfully!")
         print(f"📁 Location: {os.path.abspath(config_file)}")
@@ -156,7 +170,7 @@ def create_config_file():
         print("1. 'config.ini' is automatically added to .gitignore")
         print("2. File permissions set to 600 (owner read/write only)")
         print("3. Never share this file or commit it to version control")
-        print("4. Passwords are stored in plain text - ensure file security")
+        print("4. Passwords are stored in the OS keyring or passphrase-encrypted where possible")
         
         # Set secure file permissions
         os.chmod(config_file, 0o600)
@@ -174,7 +188,13 @@ def create_config_file():
         return False
 
 if __name__ == "__main__":
-    success = create_config_file()
+    # Usage: create_config.py [--passphrase]
+    # --passphrase encrypts stored passwords with Fernet instead of the OS keyring
+    passphrase = None
+    if '--passphrase' in sys.argv:
+        passphrase = getpass("🔐 Choose a passphrase to encrypt stored passwords (input hidden): ")
+
+    success = create_config_file(passphrase)
     if success:
         print("\n🎉 Setup complete! You can now run your Python scripts safely.")
     else:
@@ -18,10 +18,24 @@ import sys
 from pathlib import Path
 
 class TableCreationWizard:
-    def __init__(self):
-        """Initialize the table creation wizard."""
+    # Valid SQL identifier: starts with a letter, then letters/digits/underscores.
+    # Compiled once instead of re-matching the pattern on every prompt retry.
+    _IDENT_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]*$')
+
+    def __init__(self, compression=None):
+        """Initialize the table creation wizard.
+
+        compression: optional 'page' or 'row' to emit the table
+        WITH (DATA_COMPRESSION = ...) - worthwhile when the table will be
+        bulk-populated, since it shrinks on-disk and buffer-pool footprint.
+        """
         self.table_name = ""
         self.columns = []
+        self.compression = compression if compression != 'none' else None
+        # Auxiliary indexes so duplicate/primary-key checks stay O(1)
+        # no matter how many columns have been defined
+        self._column_names = set()
+        self._has_pk = False
         
         # Common SQL Server data types
         self.data_types = {
@@ -39,24 +53,27 @@ class TableCreationWizard:
     
     def display_data_types(self):
         """Display available data types."""
-        print("\n📊 Available Data Types:")
-        print("1.  NVARCHAR(100)  - Text (up to 100 characters)")
-        print("2.  INT            - Integer number")
-        print("3.  DECIMAL(10,2)  - Decimal number (10 digits, 2 decimal places)")
-        print("4.  DATETIME2      - Date and time")
-        print("5.  BIT            - Boolean (True/False)")
-        print("6.  BIGINT         - Large integer")
-        print("7.  NVARCHAR(50)   - Short text (up to 50 characters)")
-        print("8.  NVARCHAR(255)  - Long text (up to 255 characters)")
-        print("9.  DATE           - Date only")
-        print("10. FLOAT          - Floating point number")
-        print("11. Custom         - Enter your own data type")
+        # Emit the whole block in one stdout write instead of one per line
+        sys.stdout.write("\n".join([
+            "\n📊 Available Data Types:",
+            "1.  NVARCHAR(100)  - Text (up to 100 characters)",
+            "2.  INT            - Integer number",
+            "3.  DECIMAL(10,2)  - Decimal number (10 digits, 2 decimal places)",
+            "4.  DATETIME2      - Date and time",
+            "5.  BIT            - Boolean (True/False)",
+            "6.  BIGINT         - Large integer",
+            "7.  NVARCHAR(50)   - Short text (up to 50 characters)",
+            "8.  NVARCHAR(255)  - Long text (up to 255 characters)",
+            "9.  DATE           - Date only",
+            "10. FLOAT          - Floating point number",
+            "11. Custom         - Enter your own data type",
+        ]) + "\n")
     
     def get_table_name(self):
         """Get table name from user."""
         while True:
             name = input("\n📋 Enter table name: ").strip()
-            if name and re.match(r'^[a-zA-Z][a-zA-Z0-9_]*$', name):
+            if name and self._IDENT_RE.match(name):
                 self.table_name = name
                 break
             else:
@@ -69,9 +86,9 @@ class TableCreationWizard:
         # Column name
         while True:
             col_name = input("Column name: ").strip()
-            if col_name and re.match(r'^[a-zA-Z][a-zA-Z0-9_]*$', col_name):
+            if col_name and self._IDENT_RE.match(col_name):
                 # Check if column already exists
-                if any(col['name'] == col_name for col in self.columns):
+                if col_name in self._column_names:
                     print(f"❌ Column '{col_name}' already exists!")
                     continue
                 break
@@ -101,7 +118,7 @@ class TableCreationWizard:
         
         # Primary key
         is_primary = False
-        if not any(col.get('primary_key', False) for col in self.columns):
+        if not self._has_pk:
             primary = input("Is this a primary key? (y/n, default: n): ").strip().lower()
             is_primary = primary in ['y', 'yes']
         
@@ -138,6 +155,9 @@ class TableCreationWizard:
         }
         
         self.columns.append(column)
+        self._column_names.add(col_name)
+        if is_primary:
+            self._has_pk = True
         print(f"✅ Added column: {col_name} ({data_type})")
     
     def display_current_table(self):
@@ -146,62 +166,40 @@ class TableCreationWizard:
             print("📋 No columns defined yet")
             return
         
-        print(f"\n📋 Current table structure for '{self.table_name}':")
-        print("-" * 60)
+        lines = [f"\n📋 Current table structure for '{self.table_name}':", "-" * 60]
         for i, col in enumerate(self.columns, 1):
             nullable_str = "NULL" if col['nullable'] else "NOT NULL"
             pk_str = " (PK)" if col['primary_key'] else ""
             identity_str = " IDENTITY" if col['identity'] else ""
             default_str = f" DEFAULT {col['default']}" if col['default'] else ""
-            
-            print(f"{i:2}. {col['name']:<20} {col['type']:<15} {nullable_str:<8}{pk_str}{identity_str}{default_str}")
+
+            lines.append(f"{i:2}. {col['name']:<20} {col['type']:<15} {nullable_str:<8}{pk_str}{identity_str}{default_str}")
+
+        # One stdout write for the whole table instead of one per row
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def generate_sql(self):
         """Generate CREATE TABLE SQL script."""
         if not self.columns:
             return None
-        
-        sql_lines = [f"CREATE TABLE {self.table_name} ("]
-        
-        column_definitions = []
-        primary_keys = []
-        
-        for col in self.columns:
-            # Build column definition
-            col_def = f"    {col['name']} {col['type']}"
-            
-            # Add IDENTITY
-            if col['identity']:
-                col_def += " IDENTITY(1,1)"
-            
-            # Add NULL/NOT NULL
-            if not col['nullable']:
-                col_def += " NOT NULL"
-            
-            # Add DEFAULT
-            if col['default']:
-                col_def += f" DEFAULT {col['default']}"
-            
-            column_definitions.append(col_def)
-            
-            # Track primary keys
-            if col['primary_key']:
-                primary_keys.append(col['name'])
-        
-        # Add column definitions
-        sql_lines.extend([def_ + "," for def_ in column_definitions])
-        
-        # Add primary key constraint
+
+        column_definitions = [
+            f"    {col['name']} {col['type']}"
+            f"{' IDENTITY(1,1)' if col['identity'] else ''}"
+            f"{'' if col['nullable'] else ' NOT NULL'}"
+            f"{' DEFAULT ' + col['default'] if col['default'] else ''}"
+            for col in self.columns
+        ]
+
+        primary_keys = [col['name'] for col in self.columns if col['primary_key']]
         if primary_keys:
-            pk_constraint = f"    CONSTRAINT PK_{self.table_name} PRIMARY KEY ({', '.join(primary_keys)})"
-            sql_lines.append(pk_constraint)
-        else:
-            # Remove trailing comma from last column
-            sql_lines[-1] = sql_lines[-1].rstrip(',')
-        
-        sql_lines.append(");")
-        
-        return '\n'.join(sql_lines)
+            column_definitions.append(
+                f"    CONSTRAINT PK_{self.table_name} PRIMARY KEY ({', '.join(primary_keys)})"
+            )
+
+        # Joining with ',\n' makes trailing commas impossible by construction
+        closing = f") WITH (DATA_COMPRESSION = {self.compression.upper()});" if self.compression else ");"
+        return f"CREATE TABLE {self.table_name} (\n" + ",\n".join(column_definitions) + "\n" + closing
     
     def save_sql_file(self, sql_content):
         """Save SQL to file."""
@@ -216,6 +214,30 @@ class TableCreationWizard:
             print(f"❌ Error saving file: {e}")
             return None
     
+    def save_bulkload_template(self):
+        """Save a companion BULK INSERT template for the table.
+
+        BULK INSERT with TABLOCK and a batch size is the fastest way to
+        drive large CSV loads into the table the wizard just defined.
+        """
+        filename = f"create_table_{self.table_name.lower()}_bulkload.sql"
+        template = (
+            f"-- Bulk-load template for {self.table_name}.\n"
+            f"-- Replace <data_file.csv> with the path to your data file.\n"
+            f"BULK INSERT {self.table_name}\n"
+            f"FROM '<data_file.csv>'\n"
+            f"WITH (FORMAT = 'CSV', TABLOCK, BATCHSIZE = 50000);\n"
+        )
+
+        try:
+            with open(filename, 'w') as f:
+                f.write(template)
+            print(f"💾 Bulk-load template saved as '{filename}'")
+            return filename
+        except Exception as e:
+            print(f"❌ Error saving file: {e}")
+            return None
+
     def run_wizard(self):
         """Run the interactive table creation wizard."""
         print("🎯 Table Creation Wizard")
@@ -263,6 +285,9 @@ class TableCreationWizard:
             index = int(input(f"\nEnter column number to remove (1-{len(self.columns)}): ")) - 1
             if 0 <= index < len(self.columns):
                 removed_col = self.columns.pop(index)
+                self._column_names.discard(removed_col['name'])
+                if removed_col['primary_key']:
+                    self._has_pk = any(col['primary_key'] for col in self.columns)
                 print(f"🗑️  Removed column: {removed_col['name']}")
             else:
                 print("❌ Invalid column number")
@@ -290,15 +315,26 @@ class TableCreationWizard:
         
         # Save to file
         filename = self.save_sql_file(sql)
-        
+
         if filename:
+            self.save_bulkload_template()
             print(f"\n🎉 Table '{self.table_name}' definition complete!")
             print(f"📄 SQL file: {filename}")
             print(f"🚀 You can now use 'populate_tables_generic.py' to populate this table with data!")
 
 def main():
     """Main function."""
-    wizard = TableCreationWizard()
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Interactively create a SQL Server table definition."
+    )
+    parser.add_argument('--compress', choices=['page', 'row', 'none'], default='none',
+                        help="emit the table WITH (DATA_COMPRESSION = PAGE|ROW) "
+                             "to shrink storage for bulk-populated tables")
+    args = parser.parse_args()
+
+    wizard = TableCreationWizard(compression=args.compress)
     wizard.run_wizard()
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Credential storage helpers for config.ini.
+
+Keeps passwords out of config.ini where possible. The 'password' value in a
+config section can be one of:
+
+1. 'keyring'                  - real password lives in the OS keyring
+2. 'fernet:<salt>:<token>'    - encrypted with a passphrase-derived Fernet key
+3. anything else              - plaintext password (legacy behavior)
+
+Scripts should call resolve_password(config_section) instead of reading the
+'password' key directly.
+"""
+
+import base64
+import os
+import sys
+from getpass import getpass
+
+KEYRING_SERVICE = 'mssql'
+PBKDF2_ITERATIONS = 200_000
+
+def store_password(server, username, password, passphrase=None):
+    """Store a password securely and return the value to write into config.ini.
+
+    With a passphrase, the password is encrypted with Fernet and the token is
+    returned for storage in the file. Otherwise the OS keyring is tried first,
+    falling back to plaintext (with a warning) if no keyring is available.
+    """
+    if passphrase:
+        return encrypt_password(password, passphrase)
+
+    try:
+        import keyring
+        keyring.set_password(KEYRING_SERVICE, f"{server}:{username}", password)
+        print("🔐 Password stored in OS keyring")
+        return 'keyring'
+    except Exception as e:
+        print(f"⚠️  Could not store password in OS keyring ({e})")
+        print("⚠️  Falling back to plaintext storage - ensure config.ini stays private")
+        return password
+
+def resolve_password(config):
+    """Resolve the real password from a config section.
+
+    Handles keyring references and Fernet-encrypted values transparently;
+    plaintext passwords are returned as-is.
+    """
+    password = config.get('password')
+
+    if password == 'keyring':
+        try:
+            import keyring
+        except ImportError:
+            print("❌ config.ini references the OS keyring but the 'keyring' package is not installed!")
+            print("Please run 'pip install keyring'.")
+            sys.exit(1)
+        server = config.get('server')
+        username = config.get('username')
+        password = keyring.get_password(KEYRING_SERVICE, f"{server}:{username}")
+        if password is None:
+            print(f"❌ No password found in OS keyring for '{server}:{username}'!")
+            print("Please run 'python create_config.py' to store it again.")
+            sys.exit(1)
+        return password
+
+    if password and password.startswith('fernet:'):
+        passphrase = getpass("🔐 Enter config passphrase (input hidden): ")
+        return decrypt_password(password, passphrase)
+
+    return password
+
+def _derive_key(passphrase, salt):
+    """Derive a Fernet key from a passphrase with PBKDF2-HMAC-SHA256."""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=PBKDF2_ITERATIONS,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(passphrase.encode()))
+
+def encrypt_password(password, passphrase):
+    """Encrypt a password with a passphrase; returns a 'fernet:...' value."""
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError:
+        print("❌ Passphrase encryption requires the 'cryptography' package!")
+        print("Please run 'pip install cryptography'.")
+        sys.exit(1)
+
+    salt = os.urandom(16)
+    token = Fernet(_derive_key(passphrase, salt)).encrypt(password.encode())
+    return f"fernet:{base64.urlsafe_b64encode(salt).decode()}:{token.decode()}"
+
+def decrypt_password(value, passphrase):
+    """Decrypt a 'fernet:<salt>:<token>' config value with a passphrase."""
+    try:
+        from cryptography.fernet import Fernet, InvalidToken
+    except ImportError:
+        print("❌ This config.ini uses passphrase encryption, which requires the 'cryptography' package!")
+        print("Please run 'pip install cryptography'.")
+        sys.exit(1)
+
+    try:
+        _, salt_b64, token = value.split(':', 2)
+        salt = base64.urlsafe_b64decode(salt_b64)
+        return Fernet(_derive_key(passphrase, salt)).decrypt(token.encode()).decode()
+    except (ValueError, InvalidToken):
+        print("❌ Could not decrypt password - wrong passphrase or corrupted config value!")
+        sys.exit(1)
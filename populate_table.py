@@ -1,84 +1,18 @@
-from faker import Faker
-import pyodbc
-import configparser
-import os
-import sys
-
-# Initialize Faker with Australian locale
-fake = Faker('en_AU')
-
-def load_config(section='REMOTE'):
-    """Load configuration from config.ini file."""
-    config_file = 'config.ini'
-    
-    if not os.path.exists(config_file):
-        print(f"❌ Configuration file '{config_file}' not found!")
-        print("Please run 'python create_config.py' first to create the configuration file.")
-        sys.exit(1)
-    
-    config = configparser.ConfigParser()
-    config.read(config_file)
-    
-    if section not in config:
-        print(f"❌ Section '{section}' not found in configuration file!")
-        print(f"Available sections: {list(config.sections())}")
-        sys.exit(1)
-    
-    return config[section]
-
-# Load configuration
-print("📖 Loading configuration...")
-config = load_config('REMOTE')  # Use REMOTE section for Azure/remote connections
+#!/usr/bin/env python3
+"""
+Legacy entry point for populating the REMOTE (Azure) SQL Server instance.
 
-# Extract connection parameters from config
-server = config.get('server')
-database = config.get('database')
-username = config.get('username')
-password = config.get('password')
-driver = config.get('driver')
-trust_cert = config.get('trust_server_certificate', 'yes')
-encrypt = config.get('encrypt', 'yes')  # Azure typically requires encryption
-timeout = config.get('connection_timeout', '30')
+This used to be a near-identical copy of populate_table_local.py with the
+config section hardcoded to REMOTE. The shared implementation now lives in
+populate_table_local.py, parameterized by --section; this wrapper just
+defaults the section to REMOTE so existing workflows keep working.
+"""
 
-print(f"🔗 Connecting to server: {server}")
-print(f"📊 Database: {database}")
-print(f"👤 Username: {username}")
-
-# Connect to SQL Server (Azure or remote)
-try:
-    conn = pyodbc.connect(
-        f'DRIVER={driver};'
-        f'SERVER={server};'
-        f'DATABASE={database};'
-        f'UID={username};'
-        f'PWD={password};'
-        f'TrustServerCertificate={trust_cert};'
-        f'Encrypt={encrypt};'
-        f'Connection Timeout={timeout}'
-    )
-    cursor = conn.cursor()
-    print("✅ Successfully connected to SQL Server!")
-    
-except pyodbc.Error as e:
-    print(f"❌ Failed to connect to SQL Server: {e}")
-    sys.exit(1)
-
-# Insert 10 rows of fake address data
-for _ in range(10):
-    street = fake.street_address()
-    city = fake.city()
-    state = fake.state_abbr()
-    postal_code = fake.postcode()
-    # print(f"Inserting: {street}, {city}, {state}, {postal_code}")
-    insert_query = """
-    INSERT INTO Addresses (StreetAddress, City, State, PostalCode)
-    VALUES (?, ?, ?, ?)
-    """
-    cursor.execute(insert_query, (street, city, state, postal_code))
+import sys
 
-# Commit the transaction
-conn.commit()
+from populate_table_local import main
 
-# Close the connection
-cursor.close()
-conn.close()
\ No newline at end of file
+if __name__ == "__main__":
+    if not any(arg.startswith('--section') for arg in sys.argv[1:]):
+        sys.argv.append('--section=REMOTE')
+    main()
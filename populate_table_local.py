@@ -1,92 +1,307 @@
-from faker import Faker
-import pyodbc
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import argparse
+import functools
 import configparser
 import os
 import sys
 
-# Initialize Faker with Australian locale
-fake = Faker('en_AU')
+from credentials import resolve_password
+
+# Faker and pyodbc are imported lazily: Faker's provider registration and
+# pyodbc's driver load cost hundreds of milliseconds, so defer them until
+# rows are actually generated / a connection is actually opened. This keeps
+# `--help` and argument errors instant.
+
+# Default SQL statement for the Addresses table
+INSERT_QUERY = """
+INSERT INTO Addresses (StreetAddress, City, State, PostalCode)
+VALUES (?, ?, ?, ?)
+"""
+
+# Faker instance and pre-bound provider methods - each fake.<provider>()
+# attribute access goes through Faker's __getattr__ provider resolution,
+# which adds up inside the row loop, so they are bound once per process
+fake = None
+street_address = city = state_abbr = postcode = None
+
+def _init_worker():
+    """Give each process its own Faker instance with pre-bound providers."""
+    global fake, street_address, city, state_abbr, postcode
+    from faker import Faker
+    fake = Faker('en_AU')
+    street_address = fake.street_address
+    city = fake.city
+    state_abbr = fake.state_abbr
+    postcode = fake.postcode
+
+def make_row(_):
+    """Generate one fake address row (runs in worker processes)."""
+    if fake is None:
+        _init_worker()
+    return (street_address(), city(), state_abbr(), postcode())
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(path, mtime):
+    """Parse a config file once per (path, mtime); repeat calls are cached."""
+    config = configparser.ConfigParser()
+    config.read(path)
+    return config
 
 def load_config(preferred_section='LOCAL', fallback_section='DEFAULT'):
     """Load configuration from config.ini file with fallback support."""
     config_file = 'config.ini'
-    
-    if not os.path.exists(config_file):
+
+    try:
+        # Keying the cache on mtime means an edited file is re-parsed while
+        # repeat lookups of an unchanged file are free
+        config = _parse_config(config_file, os.path.getmtime(config_file))
+    except OSError:
         print(f"❌ Configuration file '{config_file}' not found!")
         print("Please run 'python create_config.py' first to create the configuration file.")
         sys.exit(1)
-    
-    config = configparser.ConfigParser()
-    config.read(config_file)
-    
+
     # Try preferred section first
     if preferred_section in config:
         print(f"✅ Using '{preferred_section}' configuration section")
         return config[preferred_section]
-    
+
     # Fall back to fallback section
     if fallback_section in config:
         print(f"⚠️  '{preferred_section}' section not found, using '{fallback_section}' section")
         return config[fallback_section]
-    
+
     # Neither section found
     print(f"❌ Neither '{preferred_section}' nor '{fallback_section}' sections found in configuration file!")
     print(f"Available sections: {list(config.sections())}")
     sys.exit(1)
 
-# Load configuration
-print("📖 Loading configuration...")
-config = load_config('LOCAL', 'DEFAULT')  # Try LOCAL first, fall back to DEFAULT
-
-# Extract connection parameters from config
-server = config.get('server')
-database = config.get('database')
-username = config.get('username')
-password = config.get('password')
-driver = config.get('driver')
-trust_cert = config.get('trust_server_certificate', 'yes')
-encrypt = config.get('encrypt', 'no')
-timeout = config.get('connection_timeout', '30')
-
-print(f"🔗 Connecting to server: {server}")
-print(f"📊 Database: {database}")
-print(f"👤 Username: {username}")
-
-# Connect to SQL Server
-try:
-    conn = pyodbc.connect(
-        f'DRIVER={driver};'
-        f'SERVER={server};'
-        f'DATABASE={database};'
-        f'UID={username};'
-        f'PWD={password};'
-        f'TrustServerCertificate={trust_cert};'
-        f'Encrypt={encrypt};'
-        f'Connection Timeout={timeout}'
+@functools.lru_cache(maxsize=4)
+def get_connection(section='LOCAL'):
+    """Connect to SQL Server for a config section, reusing connections.
+
+    The TLS handshake and authentication cost hundreds of milliseconds,
+    so connections are cached per section and reused across repeated
+    populate() calls in the same process.
+    """
+    import pyodbc
+
+    config = load_config(section, 'DEFAULT')
+
+    server = config.get('server')
+    database = config.get('database')
+    username = config.get('username')
+    password = resolve_password(config)
+    driver = config.get('driver')
+    trust_cert = config.get('trust_server_certificate', 'yes')
+    # Remote servers (Azure SQL in particular) typically require encryption,
+    # so default it on for REMOTE and off for local connections
+    encrypt = config.get('encrypt', 'yes' if section == 'REMOTE' else 'no')
+    timeout = config.get('connection_timeout', '30')
+
+    print(f"🔗 Connecting to server: {server}")
+    print(f"📊 Database: {database}")
+    print(f"👤 Username: {username}")
+
+    try:
+        conn = pyodbc.connect(
+            f'DRIVER={driver};'
+            f'SERVER={server};'
+            f'DATABASE={database};'
+            f'UID={username};'
+            f'PWD={password};'
+            f'TrustServerCertificate={trust_cert};'
+            f'Encrypt={encrypt};'
+            f'Connection Timeout={timeout}'
+        )
+        # Be explicit: some ODBC drivers silently enable autocommit, which
+        # would turn every batched insert into a per-row commit
+        conn.autocommit = False
+        print("✅ Successfully connected to SQL Server!")
+        return conn
+
+    except pyodbc.Error as e:
+        print(f"❌ Failed to connect to SQL Server: {e}")
+        sys.exit(1)
+
+def generate_rows(n, seed=None, cache=None, high_fidelity=False):
+    """Generate n fake address rows, optionally seeded and/or cached on disk.
+
+    By default rows are sampled with the vectorized NumPy generator in
+    au_fake (falling back to Faker if numpy is missing); --high-fidelity
+    forces Faker's realistic providers. With --cache, rows are memoized to
+    a pickle file keyed by (seed, n, schema hash); a matching cache skips
+    generation entirely on repeat runs. With --seed, Faker generation is
+    single-process and seeded via fake.seed_instance so the same rows come
+    out every time (a process pool would interleave worker output
+    nondeterministically).
+    """
+    import hashlib
+    import pickle
+
+    schema_hash = hashlib.sha256(INSERT_QUERY.encode()).hexdigest()
+
+    if cache and os.path.exists(cache):
+        with open(cache, 'rb') as f:
+            payload = pickle.load(f)
+        if (payload.get('seed') == seed and payload.get('n') == n
+                and payload.get('schema_hash') == schema_hash):
+            print(f"📦 Loaded {n} cached rows from '{cache}'")
+            return payload['rows']
+        print(f"⚠️  Cache '{cache}' doesn't match (seed/n/schema changed), regenerating")
+
+    rows = None
+    if not high_fidelity:
+        try:
+            from au_fake import sample_rows
+            rows = sample_rows(n, seed)
+        except ImportError:
+            print("⚠️  numpy not installed, falling back to Faker generation")
+
+    if rows is None:
+        if seed is not None:
+            _init_worker()
+            fake.seed_instance(seed)
+            rows = [make_row(i) for i in range(n)]
+        else:
+            with ProcessPoolExecutor(initializer=_init_worker) as executor:
+                rows = list(executor.map(make_row, range(n), chunksize=1000))
+
+    if cache:
+        with open(cache, 'wb') as f:
+            pickle.dump({'seed': seed, 'n': n, 'schema_hash': schema_hash, 'rows': rows}, f)
+        print(f"💾 Cached {n} rows to '{cache}'")
+
+    return rows
+
+def insert_in_batches(conn, cursor, sql, row_iter, batch=10_000, commit_every=10):
+    """Insert rows from an iterator in fixed-size executemany batches.
+
+    Only one batch of rows is held in memory at a time, so total row count
+    doesn't affect memory usage. Commits every `commit_every` batches.
+    """
+    inserted = 0
+    batches = 0
+    while True:
+        batch_rows = list(islice(row_iter, batch))
+        if not batch_rows:
+            break
+        cursor.executemany(sql, batch_rows)
+        inserted += len(batch_rows)
+        batches += 1
+        if batches % commit_every == 0:
+            conn.commit()
+        print(f"   ✅ Inserted {inserted} rows so far...")
+    return inserted
+
+def bulk_insert(rows, config):
+    """Stream rows into Addresses via the BCP bulk-copy protocol.
+
+    BCP uploads rows as a single binary stream instead of parameterized
+    INSERTs, which is much faster for very large row counts. Requires the
+    optional 'bcpandas' package.
+    """
+    try:
+        import pandas as pd
+        from bcpandas import SqlCreds, to_sql
+    except ImportError:
+        print("❌ The --bulk option requires the 'bcpandas' package!")
+        print("Please run 'pip install bcpandas' to use the bulk-copy path.")
+        sys.exit(1)
+
+    df = pd.DataFrame(rows, columns=['StreetAddress', 'City', 'State', 'PostalCode'])
+    creds = SqlCreds(
+        config.get('server'),
+        config.get('database'),
+        config.get('username'),
+        resolve_password(config),
     )
-    cursor = conn.cursor()
-    print("✅ Successfully connected to SQL Server!")
-    
-except pyodbc.Error as e:
-    print(f"❌ Failed to connect to SQL Server: {e}")
-    sys.exit(1)
+    to_sql(df, 'Addresses', creds, index=False, if_exists='append', batch_size=50_000)
+    return len(df)
+
+def populate(n, section='LOCAL', conn=None, batch=10_000, bulk=False, seed=None,
+             cache=None, high_fidelity=False):
+    """Generate n fake address rows and insert them into Addresses.
 
-# Insert 10 rows of fake address data
-for _ in range(10):
-    street = fake.street_address()
-    city = fake.city()
-    state = fake.state_abbr()
-    postal_code = fake.postcode()
-    # print(f"Inserting: {street}, {city}, {state}, {postal_code}")
-    insert_query = """
-    INSERT INTO Addresses (StreetAddress, City, State, PostalCode)
-    VALUES (?, ?, ?, ?)
+    Accepts an existing connection so callers (including the stdin loop in
+    __main__) can reuse one connection across many batches instead of
+    paying the handshake cost every time.
     """
-    cursor.execute(insert_query, (street, city, state, postal_code))
+    if conn is None:
+        conn = get_connection(section)
+
+    cursor = conn.cursor()
+    # Enable fast_executemany so pyodbc packs all rows into a single batch
+    # instead of one network round-trip per INSERT
+    cursor.fast_executemany = True
+    cursor.arraysize = 10_000
+
+    print(f"📝 Generating and inserting {n} rows of fake address data...")
+    try:
+        if high_fidelity and seed is None and cache is None:
+            # Faker path without reproducibility/caching: fan generation out
+            # across CPU cores (Faker is CPU-bound for large row counts) and
+            # stream the results into fixed-size insert batches. The DB
+            # connection stays in this parent process only.
+            with ProcessPoolExecutor(initializer=_init_worker) as executor:
+                row_iter = executor.map(make_row, range(n), chunksize=1000)
+                if bulk:
+                    total = bulk_insert(list(row_iter), load_config(section, 'DEFAULT'))
+                else:
+                    total = insert_in_batches(conn, cursor, INSERT_QUERY, row_iter, batch=batch)
+        else:
+            # Vectorized/reproducible/cached paths: rows are fully materialized
+            rows = generate_rows(n, seed=seed, cache=cache, high_fidelity=high_fidelity)
+            if bulk:
+                total = bulk_insert(rows, load_config(section, 'DEFAULT'))
+            else:
+                total = insert_in_batches(conn, cursor, INSERT_QUERY, iter(rows), batch=batch)
+        conn.commit()
+    except Exception:
+        # Don't leave a partial batch behind if anything fails mid-insert
+        conn.rollback()
+        raise
+    print(f"✅ Inserted {total} rows into Addresses")
+
+    cursor.close()
+    return total
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Populate the local Addresses table with fake Australian address data."
+    )
+    parser.add_argument('rows', nargs='?', type=int, default=10,
+                        help="number of rows to insert (default: 10)")
+    parser.add_argument('batch', nargs='?', type=int, default=10_000,
+                        help="executemany batch size (default: 10000)")
+    parser.add_argument('--bulk', action='store_true',
+                        help="stream rows via the BCP bulk-copy protocol (requires bcpandas)")
+    parser.add_argument('--stdin', action='store_true',
+                        help="read one row count per line from stdin, reusing a single connection")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="seed Faker for reproducible rows (forces single-process generation)")
+    parser.add_argument('--cache', default=None, metavar='PATH',
+                        help="pickle generated rows to PATH and reuse them on matching repeat runs")
+    parser.add_argument('--high-fidelity', action='store_true',
+                        help="generate rows with Faker's realistic providers instead of the "
+                             "faster vectorized NumPy sampler")
+    parser.add_argument('--section', choices=['LOCAL', 'REMOTE', 'DEFAULT'], default='LOCAL',
+                        help="config.ini section to connect with (default: LOCAL)")
+    args = parser.parse_args()
 
-# Commit the transaction
-conn.commit()
+    if args.stdin:
+        # Long-running mode: one populate() per input line, one connection
+        conn = get_connection(args.section)
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                populate(int(line), args.section, conn=conn, batch=args.batch, bulk=args.bulk,
+                         seed=args.seed, cache=args.cache, high_fidelity=args.high_fidelity)
+        conn.close()
+    else:
+        populate(args.rows, args.section, batch=args.batch, bulk=args.bulk,
+                 seed=args.seed, cache=args.cache, high_fidelity=args.high_fidelity)
+        get_connection(args.section).close()
 
-# Close the connection
-cursor.close()
-conn.close()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
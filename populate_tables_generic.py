@@ -9,16 +9,63 @@ This script can:
 4. Populate tables with specified number of records
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+import functools
+import hashlib
 import os
+import pickle
 import re
+from datetime import datetime, timedelta
 import pyodbc
 import configparser
 import sys
 from faker import Faker
 from pathlib import Path
 
+from credentials import resolve_password
+
 # Initialize Faker with Australian locale
 fake = Faker('en_AU')
+# Faker's shared random.Random, bound once: fake.random_int and
+# fake.random.uniform both route through provider/attribute indirection
+# on every call, while _RNG.randint/_RNG.uniform are direct method calls
+_RNG = fake.random
+
+# Rows per executemany batch
+BATCH_SIZE = 1000
+
+# Row count at which the BCP bulk-copy path beats parameterized inserts
+BULK_COPY_THRESHOLD = 50_000
+
+# Bump whenever schema parsing changes shape or behavior: the version is
+# part of the .schema_cache key, so old entries stop matching instead of
+# serving results from a parser that no longer exists
+_SCHEMA_PARSER_VERSION = 2
+
+# Schema-parsing patterns, compiled once instead of per call
+_CREATE_TABLE_RE = re.compile(r'CREATE\s+TABLE\s+(\w+)', re.IGNORECASE)
+_TABLE_DEF_RE = re.compile(r'CREATE\s+TABLE\s+\w+\s*\((.*)\)', re.IGNORECASE | re.DOTALL)
+_LENGTH_RE = re.compile(r'\((\d+)\)')
+
+# Keyword -> generator dispatch for string columns, in priority order.
+# Matched as substrings of the lowercased column name, so CamelCase,
+# snake_case and ALLCAPS names all classify alike; the scan runs once per
+# column when the plan is built, never per row. 'name' is refined to
+# first/last name by the lookup code.
+_NAME_GENERATORS = {
+    'address': fake.street_address,
+    'street': fake.street_address,
+    'city': fake.city,
+    'state': fake.state_abbr,
+    'postal': fake.postcode,
+    'zip': fake.postcode,
+    'country': lambda: 'Australia',
+    'name': fake.name,
+    'email': fake.email,
+    'phone': fake.phone_number,
+    'company': fake.company,
+}
 
 class TablePopulator:
     def __init__(self):
@@ -26,19 +73,20 @@ class TablePopulator:
         self.config = None
         self.connection = None
         self.cursor = None
+        self.fast_executemany = False
         
     def select_database_config(self):
         """Allow user to select which database configuration to use."""
         config_file = 'config.ini'
-        
-        if not os.path.exists(config_file):
+
+        config = configparser.ConfigParser()
+        # read() returns the list of files it parsed, so a missing file shows
+        # up as an empty result - no separate exists() check needed
+        if not config.read(config_file):
             print(f"❌ Configuration file '{config_file}' not found!")
             print("Please run 'python create_config.py' first to create the configuration file.")
             sys.exit(1)
         
-        config = configparser.ConfigParser()
-        config.read(config_file)
-        
         available_sections = [section for section in config.sections() if section in ['LOCAL', 'REMOTE']]
         
         if not available_sections:
@@ -89,7 +137,7 @@ class TablePopulator:
             server = self.config.get('server')
             database = self.config.get('database')
             username = self.config.get('username')
-            password = self.config.get('password')
+            password = resolve_password(self.config)
             driver = self.config.get('driver')
             trust_cert = self.config.get('trust_server_certificate', 'yes')
             encrypt = self.config.get('encrypt', 'no')
@@ -109,7 +157,23 @@ class TablePopulator:
                 f'Encrypt={encrypt};'
                 f'Connection Timeout={timeout}'
             )
+            # Be explicit: some ODBC drivers silently enable autocommit,
+            # which would turn every insert into its own transaction
+            self.connection.autocommit = False
             self.cursor = self.connection.cursor()
+            self.cursor.arraysize = 10_000
+            # Pack each executemany batch into a single TDS RPC instead of
+            # one round trip per row; not every driver supports it, so
+            # remember whether it took and fall back to multi-row VALUES
+            # statements when it didn't
+            try:
+                self.cursor.fast_executemany = True
+                self.fast_executemany = True
+            except (AttributeError, pyodbc.Error):
+                self.fast_executemany = False
+            # Suppress the "N rows affected" message per statement so the
+            # server doesn't stream a DONE token back for every insert
+            self.cursor.execute('SET NOCOUNT ON')
             print("✅ Successfully connected to SQL Server!")
             return True
             
@@ -118,139 +182,378 @@ class TablePopulator:
             return False
     
     def discover_table_files(self):
-        """Discover all SQL table files in the current directory."""
-        sql_files = []
-        current_dir = Path('.')
-        
-        for file in current_dir.glob('*.sql'):
-            if file.name.lower().startswith('create_table') or file.name.lower().endswith('_table.sql'):
-                sql_files.append(file)
-        
-        return sql_files
+        """Discover all SQL table files in the current directory.
+
+        os.scandir yields directory entries with file-type info already
+        attached, avoiding the extra stat per path that Path.glob does.
+        """
+        with os.scandir('.') as entries:
+            return [
+                Path(entry.name) for entry in entries
+                if entry.is_file() and entry.name.endswith('.sql')
+                and (entry.name.lower().startswith('create_table')
+                     or entry.name.lower().endswith('_table.sql'))
+            ]
     
     def parse_table_schema(self, sql_file):
         """Parse a SQL CREATE TABLE file to extract table name and column information."""
         try:
-            with open(sql_file, 'r') as f:
-                sql_content = f.read()
-            
-            # Extract table name
-            table_match = re.search(r'CREATE\s+TABLE\s+(\w+)', sql_content, re.IGNORECASE)
-            if not table_match:
+            # Serve an unchanged file from the on-disk cache: one stat and
+            # one pickle.load instead of re-reading and re-parsing
+            cache_path = self._schema_cache_path(sql_file)
+            if cache_path is not None and cache_path.exists():
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+
+            # One read() of raw bytes, decoded in a single pass; 'replace'
+            # keeps a stray non-UTF-8 byte from aborting the whole parse
+            sql_content = Path(sql_file).read_bytes().decode('utf-8', 'replace')
+
+            # Prefer the sqlparse tokenizer (handles nested parens like
+            # DECIMAL(10,2) correctly); fall back to the regex parser when
+            # sqlparse isn't installed or doesn't recognize the statement
+            parsed = None
+            try:
+                parsed = self._parse_schema_sqlparse(sql_content)
+            except ImportError:
+                pass
+            if parsed is None:
+                parsed = self._parse_schema_regex(sql_content)
+            if parsed is None:
                 return None
-            
-            table_name = table_match.group(1)
-            
-            # Extract columns (simplified parser)
-            columns = []
-            column_pattern = r'(\w+)\s+([\w\(\)\,\s]+)(?:NOT\s+NULL|NULL)?(?:DEFAULT\s+[^,\)]+)?'
-            
-            # Find the content between parentheses after CREATE TABLE
-            table_def_match = re.search(r'CREATE\s+TABLE\s+\w+\s*\((.*)\)', sql_content, re.IGNORECASE | re.DOTALL)
-            if table_def_match:
-                table_definition = table_def_match.group(1)
-                
-                # Split by commas but be careful with function calls like SYSDATETIME()
-                lines = table_definition.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    if line and not line.startswith('--') and not 'PRIMARY KEY' in line.upper() and not 'CONSTRAINT' in line.upper():
-                        # Extract column name and type
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            col_name = parts[0].strip(',')
-                            col_type = parts[1].upper()
-                            
-                            # Skip IDENTITY columns for data generation
-                            if 'IDENTITY' not in line.upper():
-                                columns.append({
-                                    'name': col_name,
-                                    'type': col_type,
-                                    'nullable': 'NOT NULL' not in line.upper(),
-                                    'has_default': 'DEFAULT' in line.upper()
-                                })
-            
-            return {
+
+            table_name, columns = parsed
+            table_info = {
                 'table_name': table_name,
                 'columns': columns,
                 'file_path': sql_file
             }
-            
+
+            if cache_path is not None:
+                cache_path.parent.mkdir(exist_ok=True)
+                with open(cache_path, 'wb') as f:
+                    pickle.dump(table_info, f)
+
+            return table_info
+
         except Exception as e:
             print(f"❌ Error parsing {sql_file}: {e}")
             return None
+
+    def _schema_cache_path(self, sql_file):
+        """Cache file for a SQL file's parsed schema.
+
+        Keyed by path, mtime and size plus which parser would run
+        (sqlparse or the regex fallback) and its version, so an edited
+        file, a parser fix or installing sqlparse all miss the cache and
+        re-parse; stale entries are just never read again. Returns None
+        if the file can't be stat'ed.
+        """
+        try:
+            stat = Path(sql_file).stat()
+        except OSError:
+            return None
+        try:
+            import sqlparse  # noqa: F401
+            parser = 'sqlparse'
+        except ImportError:
+            parser = 'regex'
+        key = repr((str(sql_file), stat.st_mtime_ns, stat.st_size,
+                    parser, _SCHEMA_PARSER_VERSION))
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return Path('.schema_cache') / digest
+
+    def _extract_column(self, definition):
+        """Turn one column-definition line into a column dict, or None."""
+        definition = definition.strip()
+        upper = definition.upper()
+        if (not definition or definition.startswith('--')
+                or 'PRIMARY KEY' in upper or 'CONSTRAINT' in upper):
+            return None
+
+        parts = definition.split()
+        if len(parts) < 2:
+            return None
+
+        # Skip IDENTITY columns for data generation
+        if 'IDENTITY' in upper:
+            return None
+
+        return {
+            'name': parts[0].strip(','),
+            'type': parts[1].strip(',').upper(),
+            'nullable': 'NOT NULL' not in upper,
+            'has_default': 'DEFAULT' in upper
+        }
+
+    def _parse_schema_sqlparse(self, sql_content):
+        """Parse the schema by walking sqlparse's token tree once.
+
+        Returns (table_name, columns) or None if the statement doesn't
+        look like a CREATE TABLE.
+        """
+        import sqlparse
+        from sqlparse import sql as sql_tree
+        from sqlparse import tokens as sql_tokens
+
+        statements = sqlparse.parse(sql_content)
+        if not statements:
+            return None
+        statement = statements[0]
+
+        # Only accept CREATE TABLE - without this guard any statement with
+        # an identifier and a parenthesis (e.g. the wizard's BULK INSERT
+        # templates, which also match the create_table* filename pattern)
+        # would be parsed into a phantom table
+        if statement.get_type() != 'CREATE':
+            return None
+        if not any(token.ttype in sql_tokens.Keyword
+                   and token.normalized == 'TABLE' for token in statement.tokens):
+            return None
+
+        table_name = None
+        paren = None
+        for token in statement.tokens:
+            if table_name is None and isinstance(token, (sql_tree.Identifier, sql_tree.Function)):
+                table_name = token.get_name()
+                # "name (col, ...)" often parses as one Function token
+                paren = next((t for t in token.tokens if isinstance(t, sql_tree.Parenthesis)), None)
+            elif paren is None and isinstance(token, sql_tree.Parenthesis):
+                paren = token
+
+        if not table_name or paren is None:
+            return None
+
+        # Split the parenthesis body on top-level commas only, tracking
+        # nesting depth so commas inside e.g. DECIMAL(10,2) don't split
+        columns = []
+        current = []
+        depth = 0
+        for token in paren.flatten():
+            if token.ttype is sql_tokens.Punctuation:
+                if token.value == '(':
+                    depth += 1
+                    if depth == 1:
+                        continue
+                elif token.value == ')':
+                    depth -= 1
+                    if depth == 0:
+                        continue
+                elif token.value == ',' and depth == 1:
+                    column = self._extract_column(''.join(current))
+                    if column:
+                        columns.append(column)
+                    current = []
+                    continue
+            current.append(token.value)
+        column = self._extract_column(''.join(current))
+        if column:
+            columns.append(column)
+
+        return table_name, columns
+
+    def _parse_schema_regex(self, sql_content):
+        """Parse the schema with the line-based regex parser (fallback)."""
+        # Extract table name
+        table_match = _CREATE_TABLE_RE.search(sql_content)
+        if not table_match:
+            return None
+
+        table_name = table_match.group(1)
+
+        # Extract columns (simplified parser)
+        columns = []
+
+        # Find the content between parentheses after CREATE TABLE
+        table_def_match = _TABLE_DEF_RE.search(sql_content)
+        if table_def_match:
+            for line in table_def_match.group(1).split('\n'):
+                column = self._extract_column(line)
+                if column:
+                    columns.append(column)
+
+        return table_name, columns
     
-    def generate_fake_data(self, column):
-        """Generate fake data based on column type."""
+    def _build_generator(self, column):
+        """Build a zero-argument generator callable for a column.
+
+        Runs the type/name classification once so the per-row hot loop is
+        a plain function call per column instead of repeating all the
+        substring checks for every record.
+        """
         col_type = column['type'].upper()
         col_name = column['name'].lower()
-        
+
         # Handle columns with default values
         if column['has_default'] and 'created' in col_name:
-            return None  # Let database handle it
-        
+            return lambda: None  # Let database handle it
+
         # String/Text types
         if any(t in col_type for t in ['NVARCHAR', 'VARCHAR', 'CHAR', 'TEXT']):
-            if 'address' in col_name or 'street' in col_name:
-                return fake.street_address()
-            elif 'city' in col_name:
-                return fake.city()
-            elif 'state' in col_name:
-                return fake.state_abbr()
-            elif 'postal' in col_name or 'zip' in col_name:
-                return fake.postcode()
-            elif 'country' in col_name:
-                return 'Australia'
-            elif 'name' in col_name:
-                if 'first' in col_name:
-                    return fake.first_name()
-                elif 'last' in col_name:
-                    return fake.last_name()
-                else:
-                    return fake.name()
-            elif 'email' in col_name:
-                return fake.email()
-            elif 'phone' in col_name:
-                return fake.phone_number()
-            elif 'company' in col_name:
-                return fake.company()
-            else:
-                # Extract length if specified
-                length_match = re.search(r'\((\d+)\)', col_type)
-                max_length = int(length_match.group(1)) if length_match else 50
-                return fake.text(max_length // 2)[:max_length]
-        
+            for keyword, generator in _NAME_GENERATORS.items():
+                if keyword in col_name:
+                    if keyword == 'name':
+                        if 'first' in col_name:
+                            return fake.first_name
+                        if 'last' in col_name:
+                            return fake.last_name
+                    return generator
+
+            # No recognized token - generate text sized to the column
+            length_match = _LENGTH_RE.search(col_type)
+            max_length = int(length_match.group(1)) if length_match else 50
+            return lambda n=max_length: fake.text(n // 2)[:n]
+
         # Numeric types
         elif any(t in col_type for t in ['INT', 'BIGINT', 'SMALLINT']):
             if 'age' in col_name:
-                return fake.random_int(min=18, max=80)
+                return functools.partial(_RNG.randint, 18, 80)
             elif 'year' in col_name:
-                return fake.random_int(min=1950, max=2025)
+                return functools.partial(_RNG.randint, 1950, 2025)
             else:
-                return fake.random_int(min=1, max=1000)
-        
+                return functools.partial(_RNG.randint, 1, 1000)
+
         # Decimal/Float types
         elif any(t in col_type for t in ['DECIMAL', 'FLOAT', 'MONEY']):
             if 'price' in col_name or 'cost' in col_name or 'amount' in col_name:
-                return round(fake.random.uniform(10.0, 1000.0), 2)
+                return lambda: round(_RNG.uniform(10.0, 1000.0), 2)
             else:
-                return round(fake.random.uniform(1.0, 100.0), 2)
-        
+                return lambda: round(_RNG.uniform(1.0, 100.0), 2)
+
         # Date/Time types
         elif any(t in col_type for t in ['DATE', 'DATETIME', 'DATETIME2']):
             if 'birth' in col_name:
-                return fake.date_of_birth()
+                return fake.date_of_birth
             else:
-                return fake.date_time_between(start_date='-1y', end_date='now')
-        
+                return functools.partial(fake.date_time_between, start_date='-1y', end_date='now')
+
         # Boolean types
         elif 'BIT' in col_type:
-            return fake.boolean()
-        
+            return fake.boolean
+
         # Default fallback
         else:
-            return fake.word()
+            return fake.word
+
+    def _build_plan(self, columns):
+        """Build the per-table list of column generators."""
+        return [self._build_generator(column) for column in columns]
+
+    def _generate_column_batch(self, column, n, fallback=None):
+        """Generate n values for one column in a single batch.
+
+        Numeric, decimal, boolean, and non-birth date columns are drawn as
+        whole NumPy arrays, keeping the inner loop in C instead of one
+        Faker call per value. Columns NumPy can't cover (strings, birth
+        dates) and environments without numpy use the per-row generator.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        col_type = column['type'].upper()
+        col_name = column['name'].lower()
+        values = None
+
+        if np is not None and not (column['has_default'] and 'created' in col_name):
+            rng = np.random.default_rng()
+
+            if any(t in col_type for t in ['INT', 'BIGINT', 'SMALLINT']):
+                if 'age' in col_name:
+                    low, high = 18, 81
+                elif 'year' in col_name:
+                    low, high = 1950, 2026
+                else:
+                    low, high = 1, 1001
+                values = rng.integers(low, high, n).tolist()
+
+            elif any(t in col_type for t in ['DECIMAL', 'FLOAT', 'MONEY']):
+                if 'price' in col_name or 'cost' in col_name or 'amount' in col_name:
+                    lo, hi = 10.0, 1000.0
+                else:
+                    lo, hi = 1.0, 100.0
+                values = np.round(rng.uniform(lo, hi, n), 2).tolist()
+
+            elif 'BIT' in col_type:
+                values = rng.integers(0, 2, n, dtype=bool).tolist()
+
+            elif any(t in col_type for t in ['DATE', 'DATETIME', 'DATETIME2']) and 'birth' not in col_name:
+                # Random timestamps within the last year, as offsets from now
+                now = datetime.now()
+                values = [now - timedelta(seconds=int(s))
+                          for s in rng.integers(0, 365 * 86_400, n)]
+
+        if values is None:
+            generator = fallback if fallback is not None else self._build_generator(column)
+            values = [generator() for _ in range(n)]
+
+        return values
+
+    def generate_fake_data(self, column):
+        """Generate fake data based on column type."""
+        return self._build_generator(column)()
     
+    @staticmethod
+    def _bulk_copy_available():
+        """Check whether the optional bcpandas/pandas stack is importable.
+
+        Probed before any rows are generated so a default install (no
+        bcpandas) goes straight to the executemany path instead of
+        materializing the full row set only to discard it.
+        """
+        try:
+            import pandas  # noqa: F401
+            import bcpandas  # noqa: F401
+            return True
+        except ImportError:
+            print("⚠️  bcpandas not installed, falling back to batched executemany")
+            return False
+
+    def _bulk_copy_load(self, table_name, column_names, rows):
+        """Load rows via the BCP bulk-copy protocol using bcpandas.
+
+        BCP streams rows as a single binary upload instead of parameterized
+        INSERTs, which is an order of magnitude faster for very large
+        loads. Callers should check _bulk_copy_available() first; runtime
+        failures (missing bcp CLI, auth errors) raise so the caller can
+        fall back to batched executemany.
+        """
+        import pandas as pd
+        from bcpandas import SqlCreds, to_sql
+
+        df = pd.DataFrame(rows, columns=column_names)
+        creds = SqlCreds(
+            self.config.get('server'),
+            self.config.get('database'),
+            self.config.get('username'),
+            resolve_password(self.config),
+        )
+        to_sql(df, table_name, creds, index=False, if_exists='append', batch_size=10_000)
+
+    def _insert_rows(self, insert_query, table_name, column_names, rows):
+        """Insert a batch of rows as efficiently as the driver allows.
+
+        With fast_executemany the plain executemany already packs the
+        whole batch into one round trip. Without it, executemany degrades
+        to one round trip per row, so instead build multi-row
+        INSERT ... VALUES (...),(...),... statements, chunked to stay
+        under SQL Server's 2100-parameter limit per statement.
+        """
+        if self.fast_executemany:
+            self.cursor.executemany(insert_query, rows)
+            return
+
+        chunk = max(1, 2099 // len(column_names))
+        row_placeholders = '(' + ', '.join(['?'] * len(column_names)) + ')'
+        for start in range(0, len(rows), chunk):
+            chunk_rows = rows[start:start + chunk]
+            values_clause = ', '.join([row_placeholders] * len(chunk_rows))
+            self.cursor.execute(
+                f"INSERT INTO {table_name} ({', '.join(column_names)}) VALUES {values_clause}",
+                list(chain.from_iterable(chunk_rows))
+            )
+
     def populate_table(self, table_info, record_count):
         """Populate a table with fake data."""
         table_name = table_info['table_name']
@@ -270,23 +573,73 @@ class TablePopulator:
         
         print(f"📝 Generating {record_count} records for table '{table_name}'...")
         print(f"🔹 Columns to populate: {', '.join(column_names)}")
-        
-        for i in range(record_count):
-            values = []
-            for column in columns:
-                fake_value = self.generate_fake_data(column)
-                values.append(fake_value)
-            
+
+        # Classify each column once; the hot loop below only calls the
+        # resulting generators
+        plan = self._build_plan(columns)
+
+        # Very large loads go through BCP, but only after probing the
+        # optional dependency - don't generate the full row set just to
+        # find out bcpandas is missing
+        all_rows = None
+        if record_count >= BULK_COPY_THRESHOLD and self._bulk_copy_available():
+            all_rows = list(zip(*(
+                self._generate_column_batch(column, record_count, fallback)
+                for column, fallback in zip(columns, plan)
+            )))
             try:
-                self.cursor.execute(insert_query, values)
-                if (i + 1) % 100 == 0 or i == record_count - 1:
-                    print(f"   ✅ Generated {i + 1}/{record_count} records")
+                self._bulk_copy_load(table_name, column_names, all_rows)
+                print(f"🎉 Successfully populated {record_count} records into '{table_name}'!")
+                return True
+            except Exception as e:
+                # bcpandas can fail at runtime even when importable (no bcp
+                # CLI on PATH, auth errors); the generated rows are reused
+                # by the batched loop below instead of crashing the run
+                print(f"⚠️  Bulk copy failed ({e}), falling back to batched executemany")
+
+        # Progress bar via tqdm when installed; otherwise throttle the
+        # per-batch print so huge loads don't flood (and slow down on) the
+        # terminal - at most ~10 progress lines per run, plus the last one
+        starts = range(0, record_count, BATCH_SIZE)
+        try:
+            from tqdm import tqdm
+            progress = tqdm(starts, unit='batch', desc=f"   {table_name}")
+        except ImportError:
+            progress = None
+        report_every = max(1, len(starts) // 10)
+
+        # Generate and insert in batches: each executemany call sends one
+        # round trip per batch rather than one per row
+        for batch_number, start in enumerate(progress if progress is not None else starts, 1):
+            count = min(BATCH_SIZE, record_count - start)
+            if all_rows is not None:
+                # Rows already materialized for an abandoned BCP attempt -
+                # insert those instead of generating everything again
+                rows = all_rows[start:start + count]
+            else:
+                rows = list(zip(*(
+                    self._generate_column_batch(column, count, fallback)
+                    for column, fallback in zip(columns, plan)
+                )))
+
+            try:
+                self._insert_rows(insert_query, table_name, column_names, rows)
+                # Commit per batch: keeps the transaction (and the server's
+                # log usage) bounded by BATCH_SIZE rows, and a failure only
+                # rolls back the current batch instead of the whole run
+                self.connection.commit()
+                if progress is None and (batch_number % report_every == 0
+                                         or start + count == record_count):
+                    sys.stdout.write(f"   ✅ Generated {start + count}/{record_count} records\n")
             except pyodbc.Error as e:
-                print(f"❌ Error inserting record {i + 1}: {e}")
+                if progress is not None:
+                    progress.close()
+                print(f"❌ Error inserting records {start + 1}-{start + count}: {e}")
+                self.connection.rollback()
                 return False
-        
-        # Commit all records
-        self.connection.commit()
+
+        if progress is not None:
+            progress.close()
         print(f"🎉 Successfully populated {record_count} records into '{table_name}'!")
         return True
     
@@ -322,12 +675,15 @@ def main():
             print("Create files like 'create_table_<name>.sql' or '<name>_table.sql'")
             return
         
-        # Parse table schemas
-        tables = []
-        for sql_file in table_files:
-            table_info = populator.parse_table_schema(sql_file)
-            if table_info:
-                tables.append(table_info)
+        # Parse table schemas in parallel - parsing is dominated by file
+        # I/O and the (GIL-releasing) reads, so a small thread pool hides
+        # the per-file latency when many .sql files are present
+        with ThreadPoolExecutor(max_workers=min(8, len(table_files))) as executor:
+            tables = [
+                table_info
+                for table_info in executor.map(populator.parse_table_schema, table_files)
+                if table_info
+            ]
         
         if not tables:
             print("❌ No valid table schemas found!")